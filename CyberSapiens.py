@@ -1,147 +1,560 @@
 import streamlit as st
-import yt_dlp
 import requests
-from PIL import Image
+from requests.adapters import HTTPAdapter
 from io import BytesIO
 import os
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse, parse_qs, ParseResult
 import time
 from pathlib import Path
 import re
+import shutil
+import asyncio
+import queue
+import threading
+import functools
+import contextlib
+import tempfile
+import aiohttp
+import aiofiles
+
+# io_uring writes through pyuring are opt-in: its AsyncFile copies and awaits
+# every chunk one at a time, so it isn't known to beat buffered aiofiles writes
+pyuring = None
+if os.environ.get('MEDIA_DOWNLOADER_IO_URING') == '1':
+    try:
+        # Optional, io_uring backed async files on Linux 5.15+
+        import pyuring
+    except (ImportError, OSError):
+        pass
+
+# Shared session so repeated requests reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+# Seconds to wait on a blocking request before giving up
+REQUEST_TIMEOUT = 10
+
+# Thumbnails never change for a video ID, so they are kept across sessions
+THUMBNAIL_CACHE_DIR = Path.home() / ".cache" / "StreamlitDownloads" / "thumbnails"
+
+# yt-dlp keeps its YouTube player JS cache here between runs
+YTDLP_CACHE_DIR = Path.home() / ".cache" / "streamlit_ytdlp"
+
+# Image downloads are read in blocks of this size, and files of at least
+# SEGMENTED_MIN_SIZE are fetched as IMAGE_SEGMENTS parallel Range requests
+IMAGE_BLOCK_SIZE = 256 * 1024
+IMAGE_SEGMENTS = 4
+SEGMENTED_MIN_SIZE = 4 * 1024 * 1024
+_IDENTITY_ENCODING = {'Accept-Encoding': 'identity'}
+
+# Largest width/height an image preview is decoded at
+PREVIEW_SIZE = (800, 800)
+
+_IMG_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'})
+_VID_DOMAINS_RE = re.compile(r'(?:^|\.)(youtube\.com|youtu\.be|vimeo\.com|dailymotion\.com)$')
+_YOUTUBE_ID_RE = re.compile(r'[A-Za-z0-9_-]{11}')
+
+# View count thresholds, largest first
+_VIEW_SUFFIXES = ((1_000_000_000, 'B'), (1_000_000, 'M'), (1_000, 'K'))
+
+
+@functools.lru_cache(maxsize=None)
+def _yt_dlp():
+    """Import yt-dlp on first use, it loads hundreds of extractor modules"""
+    import yt_dlp
+    return yt_dlp
+
+
+def _parse_url(url):
+    """Parse a URL unless it already is a ParseResult"""
+    return url if isinstance(url, ParseResult) else urlparse(url)
 
 
 def get_youtube_id(url):
     """Extract YouTube video ID from URL"""
-    if 'youtu.be' in url:
-        return url.split('/')[-1]
-    elif 'youtube.com' in url:
-        query = parse_qs(urlparse(url).query)
-        return query.get('v', [None])[0]
-    return None
+    parsed_url = _parse_url(url)
+    # hostname is lowercased and has no port, the same value is_video_url checks
+    match = _VID_DOMAINS_RE.search(parsed_url.hostname or '')
+    domain = match.group(1) if match else None
+    if domain == 'youtu.be':
+        youtube_id = parsed_url.path.strip('/')
+    elif domain == 'youtube.com':
+        query = parse_qs(parsed_url.query)
+        youtube_id = query.get('v', [''])[0]
+    else:
+        return None
+    # IDs end up in file paths, so reject anything that isn't a real ID
+    return youtube_id if _YOUTUBE_ID_RE.fullmatch(youtube_id) else None
 
 
 def get_video_info(url):
     """Get video information using yt-dlp"""
+    # Normalize YouTube URLs so variants like ?t=123 share a cache entry
+    parsed_url = _parse_url(url)
+    youtube_id = get_youtube_id(parsed_url)
+    if youtube_id:
+        url = f"https://www.youtube.com/watch?v={youtube_id}"
+    else:
+        url = parsed_url.geturl()
     try:
-        ydl_opts = {
-            'format': 'best',
-            'extract_flat': True,
-            'no_warnings': True,
-            'quiet': True
-        }
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            return {
-                'title': info.get('title', 'Unknown Title'),
-                'thumbnail': info.get('thumbnail'),
-                'duration': info.get('duration'),
-                'description': info.get('description', 'No description available'),
-                'uploader': info.get('uploader', 'Unknown uploader'),
-                'view_count': info.get('view_count', 0),
-            }
+        return _fetch_video_info(url)
     except Exception as e:
         st.error(f"Error fetching video info: {str(e)}")
         return None
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_video_info(url):
+    """Fetch video metadata, cached per URL across reruns"""
+    ydl_opts = {
+        'skip_download': True,
+        'ignore_no_formats_error': True,
+        'extract_flat': 'in_playlist',
+        'no_warnings': True,
+        'quiet': True,
+        'cachedir': str(YTDLP_CACHE_DIR),
+        # Only metadata is needed for the preview, so skip format
+        # resolution, manifests and the player JS deciphering
+        'youtube_include_dash_manifest': False,
+        'youtube_include_hls_manifest': False,
+        'extractor_args': {
+            'youtube': {
+                'player_skip': ['configs', 'webpage', 'js'],
+                'skip': ['dash', 'hls', 'translated_subs'],
+            },
+        },
+    }
+    with _yt_dlp().YoutubeDL(ydl_opts) as ydl:
+        info = ydl.extract_info(url, download=False)
+        return {
+            'title': info.get('title', 'Unknown Title'),
+            'thumbnail': info.get('thumbnail'),
+            'duration': info.get('duration'),
+            'description': info.get('description', 'No description available'),
+            'uploader': info.get('uploader', 'Unknown uploader'),
+            'view_count': info.get('view_count', 0),
+        }
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_image_preview(url):
+    """Fetch an image for preview, cached per URL across reruns"""
+    from PIL import Image
+
+    response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    image = Image.open(BytesIO(response.content))
+    # Let JPEG decode at a reduced scale instead of full resolution
+    image.draft('RGB', PREVIEW_SIZE)
+    image.thumbnail(PREVIEW_SIZE, Image.Resampling.LANCZOS)
+    return image
+
+
+@functools.lru_cache(maxsize=256)
+def _thumb_bytes(youtube_id):
+    """Get a YouTube thumbnail, from the on-disk cache when possible"""
+    path = THUMBNAIL_CACHE_DIR / f"{youtube_id}.jpg"
+    if path.exists():
+        return path.read_bytes()
+    response = SESSION.get(f"https://i.ytimg.com/vi/{youtube_id}/hqdefault.jpg", timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    # The cache folder may have been removed after setup_download_folders ran
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write through a temp file so readers never see a half-written thumbnail
+    with tempfile.NamedTemporaryFile(dir=path.parent, suffix='.tmp', delete=False) as f:
+        tmp_path = Path(f.name)
+    with _remove_on_error(tmp_path):
+        tmp_path.write_bytes(response.content)
+        os.replace(tmp_path, path)
+    return response.content
+
+
+@st.cache_resource(show_spinner=False)
 def setup_download_folders():
     """Create downloads folders if they don't exist"""
     downloads_path = Path.home() / "Downloads" / "StreamlitDownloads"
     video_path = downloads_path / "Videos"
     image_path = downloads_path / "Images"
 
-    for path in [downloads_path, video_path, image_path]:
+    for path in [downloads_path, video_path, image_path, THUMBNAIL_CACHE_DIR, YTDLP_CACHE_DIR]:
         path.mkdir(parents=True, exist_ok=True)
 
     return str(video_path), str(image_path)
 
 
+# Each folder change adds a new key, so only keep the latest few listings
+@st.cache_data(show_spinner=False, max_entries=8)
+def _list_dir(path, mtime_ns):
+    """List files in a folder, newest first, cached until the folder's mtime changes"""
+    # mtime_ns is only part of the cache key, adding or removing a file bumps it
+    files = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                files.append((entry.stat().st_mtime, entry.name))
+            except FileNotFoundError:
+                # yt-dlp removes its fragment files while a download runs
+                continue
+    files.sort(key=lambda file: (-file[0], file[1].lower()))
+    return [name for _, name in files]
+
+
 def is_video_url(url):
     """Check if the URL is likely a video URL"""
-    video_domains = ['youtube.com', 'youtu.be', 'vimeo.com', 'dailymotion.com']
-    parsed_url = urlparse(url)
-    return any(domain in parsed_url.netloc for domain in video_domains)
+    return bool(_VID_DOMAINS_RE.search(_parse_url(url).hostname or ''))
 
 
 def is_image_url(url):
     """Check if the URL points to an image"""
-    image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp']
-    parsed_url = urlparse(url)
-    return any(parsed_url.path.lower().endswith(ext) for ext in image_extensions)
+    return os.path.splitext(_parse_url(url).path.lower())[1] in _IMG_EXTS
+
+
+def classify_url(url):
+    """Classify a URL as 'video', 'image' or None, along with its YouTube ID"""
+    parsed_url = _parse_url(url)
+    if is_video_url(parsed_url):
+        return 'video', get_youtube_id(parsed_url)
+    if is_image_url(parsed_url):
+        return 'image', None
+    return None, None
 
 
 def format_duration(seconds):
     """Format duration in seconds to HH:MM:SS"""
     if not seconds:
         return "Unknown duration"
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    seconds = seconds % 60
-    if hours > 0:
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-    return f"{minutes:02d}:{seconds:02d}"
+    # yt-dlp reports float durations for some sites, which :02d rejects
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
 
 
 def format_views(view_count):
     """Format view count with K, M, B suffixes"""
     if not view_count:
         return "No views"
-    if view_count < 1000:
-        return str(view_count)
-    elif view_count < 1000000:
-        return f"{view_count / 1000:.1f}K"
-    elif view_count < 1000000000:
-        return f"{view_count / 1000000:.1f}M"
-    return f"{view_count / 1000000000:.1f}B"
+    for limit, suffix in _VIEW_SUFFIXES:
+        if view_count >= limit:
+            return f"{view_count / limit:.1f}{suffix}"
+    return str(view_count)
+
+
+def _make_progress_hook(on_progress, cancel_event=None, interval=0.15):
+    """Build a yt-dlp progress hook that reports progress at most every interval seconds"""
+    last_update = 0.0
 
+    def hook(d):
+        nonlocal last_update
+        if cancel_event is not None and cancel_event.is_set():
+            raise _yt_dlp().utils.DownloadCancelled()
+        now = time.monotonic()
+        if d['status'] != 'downloading' or now - last_update <= interval:
+            return
+        last_update = now
+        # HLS/DASH downloads only report an estimated total, which can undershoot
+        total = d.get('total_bytes') or d.get('total_bytes_estimate')
+        if total:
+            on_progress(min(d['downloaded_bytes'] / total, 1.0))
 
-def download_video(url, output_path):
+    return hook
+
+
+def download_video(url, output_path, on_progress=None, cancel_event=None):
     """Download video using yt-dlp"""
+    yt_dlp = _yt_dlp()
+    on_progress = on_progress or _set_progress
     try:
         ydl_opts = {
-            'format': 'best',
+            # Split DASH formats are fetched fragment by fragment on worker threads,
+            # merging them needs ffmpeg so fall back to a progressive stream without it
+            'format': 'bv*+ba/best' if shutil.which('ffmpeg') else 'best',
+            'concurrent_fragment_downloads': 8,
+            'http_chunk_size': 10 * 1024 * 1024,
+            'buffersize': 1024 * 1024,
             'outtmpl': os.path.join(output_path, '%(title)s.%(ext)s'),
-            'progress_hooks': [lambda d: st.session_state.update(
-                progress=d['downloaded_bytes'] / d['total_bytes'] if 'total_bytes' in d else 0
-            ) if d['status'] == 'downloading' else None],
+            'cachedir': str(YTDLP_CACHE_DIR),
+            'progress_hooks': [_make_progress_hook(on_progress, cancel_event)],
         }
 
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            st.session_state.progress = 0
+            on_progress(0)
             info = ydl.extract_info(url, download=True)
             return True, f"Successfully downloaded: {info['title']}"
+    except yt_dlp.utils.DownloadCancelled:
+        return False, "Download cancelled"
     except Exception as e:
         return False, f"Error downloading video: {str(e)}"
 
 
-def download_image(url, output_path):
-    """Download image using requests"""
+def start_video_download(url, video_path, image_path, video_info):
+    """Run fetch_all on a daemon thread so the UI keeps rerendering"""
+    job = {
+        'queue': queue.Queue(),
+        'cancel': threading.Event(),
+        'progress': 0.0,
+        'result': None,
+    }
+
+    def run():
+        # st.session_state is not available on this thread, so report through the queue
+        def on_progress(value):
+            job['queue'].put(('progress', value))
+
+        # Always finish the job, or the UI keeps polling it for the rest of the session
+        try:
+            result = asyncio.run(fetch_all(url, video_path, image_path, video_info, on_progress, job['cancel']))
+        except Exception as e:
+            result = False, f"Error downloading video: {str(e)}"
+        job['queue'].put(('done', result))
+
+    job['thread'] = threading.Thread(target=run, daemon=True)
+    job['thread'].start()
+    return job
+
+
+def poll_video_download(job):
+    """Drain a download job's queue, returning its (success, message) once finished"""
+    while True:
+        try:
+            kind, value = job['queue'].get_nowait()
+        except queue.Empty:
+            return job['result']
+        if kind == 'progress':
+            job['progress'] = value
+        else:
+            job['result'] = value
+
+
+def _set_progress(value):
+    """Store download progress in the session state"""
+    st.session_state.progress = value
+
+
+def _open_for_write(filepath):
+    """Open a file for async writes, through io_uring when pyuring is enabled"""
+    if pyuring is not None:
+        # pyuring probes the kernel itself and falls back to threaded writes
+        return pyuring.open(filepath, 'wb')
+    return aiofiles.open(filepath, 'wb', buffering=1024 * 1024)
+
+
+@contextlib.contextmanager
+def _remove_on_error(filepath):
+    """Delete a partially written file if the block raises"""
+    try:
+        yield
+    except BaseException:
+        if os.path.exists(filepath):
+            os.remove(filepath)
+        raise
+
+
+def _preallocate(filepath, size):
+    """Create filepath with size bytes reserved so segments can be written in place"""
+    with open(filepath, 'wb') as f:
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+        except (AttributeError, OSError):
+            # Not available on this platform or filesystem
+            f.truncate(size)
+
+
+class _RangeNotHonoured(Exception):
+    """A segment came back as something other than the requested range"""
+
+
+async def _probe_ranges(session, url):
+    """Return (size, validator) if url is worth fetching in Range segments, else None
+
+    validator is the ETag or Last-Modified value segments send as If-Range,
+    so every segment comes from the same version of the file.
+    """
+    try:
+        async with session.head(url, headers=_IDENTITY_ENCODING, allow_redirects=True) as response:
+            if (response.status != 200
+                    or response.headers.get('Accept-Ranges') != 'bytes'
+                    or response.headers.get('Content-Encoding')):
+                return None
+            size = response.content_length or 0
+            etag = response.headers.get('ETag')
+            # If-Range only accepts strong ETags
+            if etag and etag.startswith('W/'):
+                etag = None
+            validator = etag or response.headers.get('Last-Modified')
+    except aiohttp.ClientError:
+        return None
+    return (size, validator) if size >= SEGMENTED_MIN_SIZE else None
+
+
+async def _gather_or_cancel(*aws):
+    """Like asyncio.gather, but cancel the others as soon as one fails"""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
     try:
-        response = requests.get(url, stream=True)
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def _download_segment(session, url, filepath, start, end, size, validator, advance):
+    """Write bytes start..end of url into the same range of filepath"""
+    headers = {**_IDENTITY_ENCODING, 'Range': f"bytes={start}-{end}"}
+    if validator:
+        headers['If-Range'] = validator
+    async with session.get(url, headers=headers) as response:
         response.raise_for_status()
+        # A 200 means the server ignored the range, or the file changed since the HEAD
+        if (response.status != 206
+                or response.headers.get('Content-Range') != f"bytes {start}-{end}/{size}"):
+            raise _RangeNotHonoured()
+
+        received = 0
+        # pyuring's AsyncFile can't seek, so segments always write through aiofiles
+        async with aiofiles.open(filepath, 'r+b', buffering=1024 * 1024) as f:
+            await f.seek(start)
+            async for data in response.content.iter_chunked(IMAGE_BLOCK_SIZE):
+                received += len(data)
+                await f.write(data)
+                advance(len(data))
+
+    if received != end - start + 1:
+        raise IOError(f"Incomplete segment: received {received} of {end - start + 1} bytes")
+
+
+async def _download_image_async(session, url, output_path, on_progress=None, filename=None):
+    """Stream an image to disk using aiohttp and aiofiles"""
+    parsed_url = _parse_url(url)
+    url = parsed_url.geturl()
+
+    filename = filename or os.path.basename(parsed_url.path)
+    if not filename:
+        filename = f"image_{int(time.time())}.jpg"
+
+    filepath = os.path.join(output_path, filename)
+
+    total_size = 0
+    downloaded = 0
+    last_update = 0.0
+
+    def advance(size):
+        nonlocal downloaded, last_update
+        downloaded += size
+        # Throttle progress updates, each one costs a Streamlit rerun signal
+        now = time.monotonic()
+        if on_progress and total_size and now - last_update > 0.1:
+            last_update = now
+            on_progress(downloaded / total_size)
+
+    ranges = await _probe_ranges(session, url)
+    if ranges:
+        # Large files are split into Range requests on parallel connections
+        total_size, validator = ranges
+        step = -(-total_size // IMAGE_SEGMENTS)
+        try:
+            with _remove_on_error(filepath):
+                _preallocate(filepath, total_size)
+                await _gather_or_cancel(*(
+                    _download_segment(
+                        session, url, filepath, start, min(start + step, total_size) - 1,
+                        total_size, validator, advance,
+                    )
+                    for start in range(0, total_size, step)
+                ))
+        except _RangeNotHonoured:
+            # Start over as a single stream
+            ranges = None
+            downloaded = 0
 
-        filename = os.path.basename(urlparse(url).path)
-        if not filename:
-            filename = f"image_{int(time.time())}.jpg"
+    if not ranges:
+        async with session.get(url) as response:
+            response.raise_for_status()
 
-        filepath = os.path.join(output_path, filename)
+            # aiohttp decodes compressed bodies, so Content-Length only counts plain ones
+            total_size = 0 if response.headers.get('Content-Encoding') else response.content_length or 0
 
-        total_size = int(response.headers.get('content-length', 0))
-        block_size = 1024
+            with _remove_on_error(filepath):
+                async with _open_for_write(filepath) as f:
+                    async for data in response.content.iter_chunked(IMAGE_BLOCK_SIZE):
+                        await f.write(data)
+                        advance(len(data))
 
-        with open(filepath, 'wb') as f:
-            if total_size == 0:
-                f.write(response.content)
-            else:
-                downloaded = 0
-                for data in response.iter_content(block_size):
-                    downloaded += len(data)
-                    f.write(data)
-                    st.session_state.progress = downloaded / total_size
+                if total_size and downloaded != total_size:
+                    raise IOError(f"Incomplete download: received {downloaded} of {total_size} bytes")
+
+    if on_progress and total_size:
+        on_progress(downloaded / total_size)
+
+    return filename
 
-        return True, f"Successfully downloaded: {filename}"
-    except Exception as e:
-        return False, f"Error downloading image: {str(e)}"
+
+async def _download_images_async(urls, output_path, on_progress=None):
+    """Download images concurrently, at most 5 at a time"""
+    semaphore = asyncio.Semaphore(5)
+
+    async with aiohttp.ClientSession() as session:
+        async def fetch(url):
+            async with semaphore:
+                return await _download_image_async(session, url, output_path, on_progress)
+
+        return await asyncio.gather(*(fetch(url) for url in urls), return_exceptions=True)
+
+
+def download_images(urls, output_path):
+    """Download several images, returning a (success, message) per URL"""
+    results = asyncio.run(_download_images_async(urls, output_path, _set_progress))
+    return [
+        (False, f"Error downloading image: {str(result)}") if isinstance(result, Exception)
+        else (True, f"Successfully downloaded: {result}")
+        for result in results
+    ]
+
+
+def download_image(url, output_path):
+    """Download image using aiohttp"""
+    return download_images([url], output_path)[0]
+
+
+async def _fetch_thumbnail(session, url):
+    """Fetch a thumbnail into memory, it is only written once the video succeeds"""
+    async with session.get(url) as response:
+        response.raise_for_status()
+        return await response.read()
+
+
+async def fetch_all(url, video_path, image_path, video_info, on_progress=None, cancel_event=None):
+    """Download a video and its thumbnail concurrently, returning the video's result"""
+    loop = asyncio.get_running_loop()
+    video = loop.run_in_executor(None, download_video, url, video_path, on_progress, cancel_event)
+
+    thumbnail_url = video_info.get('thumbnail')
+    if not thumbnail_url:
+        return await video
+
+    # A stalled thumbnail CDN shouldn't hold up a job whose video already finished
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)) as session:
+        # video_info's thumbnail is usually higher resolution than the cached hqdefault preview
+        thumbnail = asyncio.ensure_future(_fetch_thumbnail(session, thumbnail_url))
+        success, message = await video
+        # A failed or cancelled video shouldn't leave its thumbnail behind
+        if not success:
+            thumbnail.cancel()
+        thumbnail_data, = await asyncio.gather(thumbnail, return_exceptions=True)
+
+    if success and isinstance(thumbnail_data, bytes):
+        # Name the thumbnail after the video, thumbnail URLs often share a basename
+        ext = os.path.splitext(urlparse(thumbnail_url).path)[1] or '.jpg'
+        filename = _yt_dlp().utils.sanitize_filename(video_info['title']) + ext
+        filepath = os.path.join(image_path, filename)
+        # The video is already on disk, a failed thumbnail write must not report it as failed
+        try:
+            with _remove_on_error(filepath):
+                async with _open_for_write(filepath) as f:
+                    await f.write(thumbnail_data)
+        except OSError:
+            pass
+    return success, message
 
 
 def main():
@@ -154,6 +567,10 @@ def main():
         st.session_state.progress = 0
 
     video_path, image_path = setup_download_folders()
+    # Folders are created once per process, so recreate them if they were deleted since
+    if not (os.path.isdir(video_path) and os.path.isdir(image_path)):
+        setup_download_folders.clear()
+        video_path, image_path = setup_download_folders()
 
     with st.expander("Download Locations"):
         st.write(f"Videos will be saved to: {video_path}")
@@ -161,13 +578,22 @@ def main():
 
     url = st.text_input("Enter URL:")
 
+    # Poll before drawing the Download Video button, which a running job disables
+    video_result = None
+    if 'video_job' in st.session_state:
+        video_result = poll_video_download(st.session_state.video_job)
+        if video_result is not None:
+            del st.session_state.video_job
+
     if url:
-        if is_video_url(url):
+        parsed_url = urlparse(url)
+        kind, youtube_id = classify_url(parsed_url)
+
+        if kind == 'video':
             # Video preview section
             col1, col2 = st.columns([2, 1])
 
             with col1:
-                youtube_id = get_youtube_id(url)
                 if youtube_id:
                     st.components.v1.iframe(
                         f"https://www.youtube.com/embed/{youtube_id}",
@@ -176,35 +602,34 @@ def main():
                     )
 
             with col2:
-                video_info = get_video_info(url)
+                video_info = get_video_info(parsed_url)
                 if video_info:
+                    if youtube_id:
+                        try:
+                            st.image(_thumb_bytes(youtube_id), use_container_width=True)
+                        except (requests.RequestException, OSError):
+                            # The thumbnail is optional, e.g. ~/.cache may be read-only
+                            pass
                     st.subheader(video_info['title'])
                     st.write(f"👤 {video_info['uploader']}")
                     st.write(f"⏱️ {format_duration(video_info['duration'])}")
                     st.write(f"👁️ {format_views(video_info['view_count'])} views")
 
-                    if st.button("Download Video"):
-                        progress_bar = st.progress(0)
-                        status_text = st.empty()
-                        status_text.text("Downloading video...")
-                        success, message = download_video(url, video_path)
-                        progress_bar.progress(1.0 if success else 0)
-                        if success:
-                            st.success(message)
-                        else:
-                            st.error(message)
-
-        elif is_image_url(url):
+                    if st.button("Download Video", disabled='video_job' in st.session_state):
+                        st.session_state.video_job = start_video_download(
+                            url, video_path, image_path, video_info
+                        )
+
+        elif kind == 'image':
             try:
-                response = requests.get(url)
-                image = Image.open(BytesIO(response.content))
+                image = load_image_preview(url)
                 st.image(image, caption="Image Preview", use_column_width=True)
 
                 if st.button("Download Image"):
                     progress_bar = st.progress(0)
                     status_text = st.empty()
                     status_text.text("Downloading image...")
-                    success, message = download_image(url, image_path)
+                    success, message = download_image(parsed_url, image_path)
                     progress_bar.progress(1.0 if success else 0)
                     if success:
                         st.success(message)
@@ -216,20 +641,37 @@ def main():
         else:
             st.warning("Unsupported URL format. Please enter a valid video or image URL.")
 
+    # Video downloads run in the background and are polled on every rerun
+    if 'video_job' in st.session_state:
+        job = st.session_state.video_job
+        st.progress(job['progress'], text="Downloading video...")
+        if st.button("Cancel Download"):
+            job['cancel'].set()
+    elif video_result is not None:
+        success, message = video_result
+        if success:
+            st.success(message)
+        else:
+            st.error(message)
+
     # Display downloads
     with st.expander("View Downloads"):
         col1, col2 = st.columns(2)
 
         with col1:
             st.subheader("📹 Videos")
-            for file in sorted(os.listdir(video_path)):
+            for file in _list_dir(video_path, os.stat(video_path).st_mtime_ns):
                 st.write(file)
 
         with col2:
             st.subheader("🖼️ Images")
-            for file in sorted(os.listdir(image_path)):
+            for file in _list_dir(image_path, os.stat(image_path).st_mtime_ns):
                 st.write(file)
 
+    if 'video_job' in st.session_state:
+        time.sleep(0.5)
+        st.rerun()
+
 
 
 if __name__ == "__main__":